@@ -169,33 +169,38 @@ class Schedule:
         return Schedule(self.num_staff, self.num_days, self.requests, self.cycle_starts, new_grid)
 
 class Evaluator:
-    def evaluate(self, schedule):
-        score = 5000 # 기본 점수 대폭 상향
-        
+    # (페널티 이름, 검사 메서드, 가중치) - 점수 계산 순서대로 나열
+    PENALTY_RULES = [
         # 1. [CRITICAL] 직능 균형
-        score -= self._check_role_balance(schedule) * 500
-        
+        ('role_balance', '_check_role_balance', 500),
         # 2. [FATAL] 야간 근무 후 휴식 (절대 규칙)
         # 야간 다음날 '휴'가 오면 점수를 마이너스로 보내버릴 정도로 강력하게 응징
-        score -= self._check_rest_after_night(schedule) * 50000 
-        
+        ('rest_after_night', '_check_rest_after_night', 50000),
         # 3. [STRICT] 정규 팀 파트너 사이클 준수
-        score -= self._check_cycle_compliance(schedule) * 500 
-        
+        ('cycle_compliance', '_check_cycle_compliance', 500),
         # 4. 리더 근무 우선권
-        score -= self._check_leader_priority(schedule) * 300
-
+        ('leader_priority', '_check_leader_priority', 300),
         # 5. 연속 근무 제한
-        score -= self._check_progressive_consecutive_work(schedule) * 100
-
+        ('consecutive_work', '_check_progressive_consecutive_work', 100),
         # 6. 연속 휴무 제한
-        score -= self._check_excessive_consecutive_off(schedule) * 50
-
+        ('consecutive_off', '_check_excessive_consecutive_off', 50),
         # 7. 근무 시간 형평성
-        score -= self._check_working_hours_fairness(schedule) * 5
+        ('hours_fairness', '_check_working_hours_fairness', 5),
+    ]
 
+    def evaluate(self, schedule):
+        score = 5000 # 기본 점수 대폭 상향
+        for penalty in self.penalty_breakdown(schedule).values():
+            score -= penalty
         return score
 
+    def penalty_breakdown(self, schedule):
+        """ 규칙별 감점(가중치 적용 후)을 {이름: 감점} 형태로 반환 """
+        breakdown = {}
+        for name, method, weight in self.PENALTY_RULES:
+            breakdown[name] = getattr(self, method)(schedule) * weight
+        return breakdown
+
     def _check_leader_priority(self, schedule):
         penalty = 0
         grid = schedule.grid
@@ -317,6 +322,19 @@ class Evaluator:
             total_hours.append(hours)
         return np.std(total_hours)
 
+class GenerationSnapshot:
+    """
+    한 세대의 진행 상황 요약.
+    - score / penalties: 이번 세대 1등 개체의 점수와 규칙별 감점
+    - best_schedule: 지금까지의 최고 근무표 (복사하지 않은 참조, .grid로 접근)
+    """
+    def __init__(self, generation, score, penalties, best_schedule, is_optimal):
+        self.generation = generation
+        self.score = score
+        self.penalties = penalties
+        self.best_schedule = best_schedule
+        self.is_optimal = is_optimal
+
 class GeneticOptimizer:
     def __init__(self, num_staff, num_days, requests, cycle_starts, pop_size=50, generations=100):
         self.num_staff = num_staff
@@ -333,8 +351,28 @@ class GeneticOptimizer:
             self.population.append(Schedule(self.num_staff, self.num_days, self.requests, self.cycle_starts))
 
     def evolve(self):
+        """ 모든 세대를 끝까지 실행하고 최고 점수 근무표를 반환 """
+        best_schedule = None
+        for snapshot in self.iter_evolve():
+            best_schedule = snapshot.best_schedule
+            if snapshot.generation % 50 == 0:
+                print(f"[알고리즘 진행중] 세대 {snapshot.generation}: 점수 = {snapshot.score:.1f}")
+            if snapshot.is_optimal:
+                print(">>> 최적해 발견! <<<")
+        return best_schedule
+
+    def iter_evolve(self, stop_event=None):
+        """
+        세대마다 GenerationSnapshot을 yield 하는 제너레이터 버전.
+        - 호출자는 원하는 시점에 반복을 멈추거나(break / close()),
+          stop_event(is_set()을 가진 객체, 예: threading.Event)를 세워 중단할 수 있음
+        - 중단 여부는 각 세대 시작 전에 확인 (협조적 취소)
+        """
         best_schedule = None
         for gen in range(self.generations):
+            if stop_event is not None and stop_event.is_set():
+                return
+
             for individual in self.population:
                 individual.score = self.evaluator.evaluate(individual)
             self.population.sort(key=lambda x: x.score, reverse=True)
@@ -342,12 +380,17 @@ class GeneticOptimizer:
             if best_schedule is None or self.population[0].score > best_schedule.score:
                 best_schedule = copy.deepcopy(self.population[0])
 
-            if gen % 50 == 0:
-                print(f"[알고리즘 진행중] 세대 {gen}: 점수 = {self.population[0].score:.1f}")
-            
-            if self.population[0].score >= 4900:
-                print(">>> 최적해 발견! <<<")
-                break
+            is_optimal = self.population[0].score >= 4900
+            yield GenerationSnapshot(
+                gen,
+                self.population[0].score,
+                self.evaluator.penalty_breakdown(self.population[0]),
+                best_schedule,
+                is_optimal,
+            )
+
+            if is_optimal:
+                return
 
             num_elites = int(self.pop_size * 0.2)
             next_generation = self.population[:num_elites]
@@ -355,5 +398,4 @@ class GeneticOptimizer:
                 parent = random.choice(self.population[:num_elites])
                 child = parent.mutate(mutation_rate=0.2) 
                 next_generation.append(child)
-            self.population = next_generation
-        return best_schedule
\ No newline at end of file
+            self.population = next_generation
\ No newline at end of file